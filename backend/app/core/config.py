@@ -17,6 +17,10 @@ from typing_extensions import Self
 
 def parse_cors(v: Any) -> list[str] | str:
     if isinstance(v, str) and not v.startswith("["):
+        if "," not in v:
+            # Single origin, the common case
+            v = v.strip()
+            return [v] if v else []
         return [i.strip() for i in v.split(",") if i.strip()]
     elif isinstance(v, list | str):
         return v
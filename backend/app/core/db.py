@@ -21,13 +21,14 @@ def init_db(session: Session) -> None:
     # This works because the models are already imported and registered from app.models
     # SQLModel.metadata.create_all(engine)
 
-    user = session.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
+    # Only existence matters; email is unique-indexed so this is one lookup
+    superuser_id = session.exec(
+        select(User.id).where(User.email == settings.FIRST_SUPERUSER)
     ).first()
-    if not user:
+    if not superuser_id:
         user_in = UserCreate(
             email=settings.FIRST_SUPERUSER,
             password=settings.FIRST_SUPERUSER_PASSWORD,
             is_superuser=True,
         )
-        user = crud.create_user(session=session, user_create=user_in)
+        crud.create_user(session=session, user_create=user_in)
@@ -10,13 +10,17 @@ Creates realistic test scenarios demonstrating:
 6. Time segment deletion
 
 Run with: python -m scripts.seed_worklog_data
+Re-running skips scenarios that are already present.
 """
 
+import logging
 import uuid
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlmodel import Session, col, select
 
 from app.core.db import engine
 from app.models import (
@@ -32,6 +36,26 @@ from app.models import (
     WorkLog,
 )
 
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 60
+
+# Decimal literals reused across scenarios, parsed once at import
+_HRS_3 = Decimal("3.00")
+_HRS_4 = Decimal("4.00")
+_HRS_5 = Decimal("5.00")
+_HRS_6 = Decimal("6.00")
+_HRS_8 = Decimal("8.00")
+_RATE_45 = Decimal("45.00")
+_RATE_50 = Decimal("50.00")
+_RATE_55 = Decimal("55.00")
+_RATE_60 = Decimal("60.00")
+_ZERO = Decimal("0.00")
+_AMT_180 = _HRS_4 * _RATE_45
+_AMT_250 = _HRS_5 * _RATE_50
+_AMT_480 = _HRS_8 * _RATE_60
+
 
 def create_test_users(session: Session) -> dict[str, uuid.UUID]:
     """Create test worker users."""
@@ -51,407 +75,386 @@ def create_test_users(session: Session) -> dict[str, uuid.UUID]:
             users["worker_b"] = existing_users[0].id
             users["worker_c"] = existing_users[0].id
         else:
-            print("WARNING: No users found. Please create users first.")
+            logger.warning("No users found. Please create users first.")
             return {}
 
     return users
 
 
-def seed_scenario_1_simple_happy_path(session: Session, worker_id: uuid.UUID) -> None:
-    """
-    Scenario 1: Simple Happy Path
-    - Worker A logs 10 hours @ $50/hr = $500
-    - Settlement run creates remittance with $500
-    """
-    print("Creating Scenario 1: Simple Happy Path...")
-
-    # Create worklog
-    worklog = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-001-SIMPLE",
-    )
-    session.add(worklog)
-    session.flush()
-
-    # Add time segments
-    base_date = date(2026, 1, 15)
-    for i in range(2):
-        segment = TimeSegment(
-            worklog_id=worklog.id,
-            hours_worked=Decimal("5.00"),
-            hourly_rate=Decimal("50.00"),
-            segment_date=base_date + timedelta(days=i),
-            notes=f"Work on feature X - Day {i+1}",
-        )
-        session.add(segment)
-
-    session.commit()
-    print(f"✓ Created worklog {worklog.id} with 10 hours of work (2 segments)")
-
-
-def seed_scenario_2_retroactive_adjustments(
-    session: Session, worker_id: uuid.UUID
+# Settlement run for January 2026 shared by the settled scenarios
+_JANUARY_SETTLEMENT = {
+    "period_start": date(2026, 1, 1),
+    "period_end": date(2026, 1, 31),
+    "run_at": datetime(2026, 2, 1, 0, 0, 0),
+    "status": SettlementStatus.COMPLETED,
+    "total_remittances_generated": 1,
+}
+
+# Each scenario is plain data: the worklogs it creates (with their time
+# segments and adjustments) and, optionally, a remittance already issued for
+# it. Segments with a "remitted_amount" get a RemittanceLine for that amount
+# on that remittance.
+SCENARIOS: list[dict[str, Any]] = [
+    {
+        # Scenario 1: Simple Happy Path
+        # - Worker A logs 10 hours @ $50/hr = $500
+        # - Settlement run creates remittance with $500
+        "title": "Scenario 1: Simple Happy Path",
+        "worker": "worker_a",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-001-SIMPLE",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_5,
+                        "hourly_rate": _RATE_50,
+                        "segment_date": date(2026, 1, 15) + timedelta(days=i),
+                        "notes": f"Work on feature X - Day {i + 1}",
+                    }
+                    for i in range(2)
+                ],
+            },
+        ],
+        "summary": ["✓ Created worklog with 10 hours of work (2 segments)"],
+    },
+    {
+        # Scenario 2: Retroactive Adjustments
+        # - Month 1: Worker B logs 20 hours → Should be paid $1000
+        # - Month 2: Quality issue → $200 deduction applied
+        # - Month 2: Worker B logs 10 hours → Should be paid $500 - $200 = $300
+        "title": "Scenario 2: Retroactive Adjustments",
+        "worker": "worker_b",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-002-MONTH1",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_5,
+                        "hourly_rate": _RATE_50,
+                        "segment_date": date(2026, 1, 5) + timedelta(days=i * 2),
+                        "notes": f"Month 1 work - Part {i + 1}",
+                        "remitted_amount": _AMT_250,
+                    }
+                    for i in range(4)
+                ],
+                # Month 2: retroactive adjustment for Month 1 work
+                "adjustments": [
+                    {
+                        "adjustment_type": AdjustmentType.DEDUCTION,
+                        "amount": Decimal("200.00"),
+                        "reason": "Quality issue found in Month 1 deliverables",
+                    }
+                ],
+            },
+            {
+                "task_identifier": "TASK-002-MONTH2",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_5,
+                        "hourly_rate": _RATE_50,
+                        "segment_date": date(2026, 2, 5) + timedelta(days=i * 2),
+                        "notes": f"Month 2 work - Part {i + 1}",
+                    }
+                    for i in range(2)
+                ],
+            },
+        ],
+        # Month 1 was settled and PAID
+        "remittance": {
+            "gross_amount": Decimal("1000.00"),
+            "adjustments_amount": _ZERO,
+            "net_amount": Decimal("1000.00"),
+            "status": RemittanceStatus.PAID,
+            "paid_at": datetime(2026, 2, 2, 0, 0, 0),
+        },
+        "summary": [
+            "✓ Created Month 1 worklog (PAID) with retroactive $200 deduction",
+            "✓ Created Month 2 worklog with 10 hours (should net $300 with adjustment)",
+        ],
+    },
+    {
+        # Scenario 3: Failed Settlement Retry
+        # - Month 1: Worker C settlement fails → Status FAILED
+        # - Month 2: New settlement includes Month 1 work + Month 2 work
+        "title": "Scenario 3: Failed Settlement Retry",
+        "worker": "worker_c",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-003-FAILED",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_8,
+                        "hourly_rate": _RATE_60,
+                        "segment_date": date(2026, 1, 10) + timedelta(days=i * 3),
+                        "notes": f"Failed settlement work - Part {i + 1}",
+                        "remitted_amount": _AMT_480,
+                    }
+                    for i in range(3)
+                ],
+            },
+        ],
+        "remittance": {
+            "gross_amount": Decimal("1440.00"),  # 24 hours * $60
+            "adjustments_amount": _ZERO,
+            "net_amount": Decimal("1440.00"),
+            "status": RemittanceStatus.FAILED,  # Payment failed!
+        },
+        "summary": [
+            "✓ Created failed remittance for Worker C ($1440 unpaid)",
+            "  Next settlement should reconcile this failed payment",
+        ],
+    },
+    {
+        # Scenario 4: Partial WorkLog Settlement
+        # - WorkLog has 3 time segments initially
+        # - First 2 segments get paid in Month 1
+        # - 3rd segment added later, should be paid in Month 2
+        "title": "Scenario 4: Partial WorkLog Settlement",
+        "worker": "worker_a",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-004-PARTIAL",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_4,
+                        "hourly_rate": _RATE_45,
+                        "segment_date": date(2026, 1, 8) + timedelta(days=i),
+                        "notes": f"Initial work - Day {i + 1}",
+                        "remitted_amount": _AMT_180,
+                    }
+                    for i in range(2)
+                ]
+                + [
+                    # 3rd segment added later (unpaid)
+                    {
+                        "hours_worked": _HRS_6,
+                        "hourly_rate": _RATE_45,
+                        "segment_date": date(2026, 2, 15),  # Added in Month 2
+                        "notes": "Additional work added later",
+                    }
+                ],
+            },
+        ],
+        "remittance": {
+            "gross_amount": Decimal("360.00"),  # 8 hours * $45
+            "adjustments_amount": _ZERO,
+            "net_amount": Decimal("360.00"),
+            "status": RemittanceStatus.PAID,
+            "paid_at": datetime(2026, 2, 2, 0, 0, 0),
+        },
+        "summary": [
+            "✓ Created partially settled worklog",
+            "  - 2 segments PAID ($360)",
+            "  - 1 segment UNPAID ($270) - to be paid in next settlement",
+        ],
+    },
+    {
+        # Scenario 5: Multi-Month Time Segments
+        # - Time segments span across settlement period boundary
+        # - Proper date-based filtering
+        "title": "Scenario 5: Multi-Month Time Segments",
+        "worker": "worker_b",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-005-MULTIMONTH",
+                "segments": [
+                    {
+                        "hours_worked": _HRS_3,
+                        "hourly_rate": _RATE_55,
+                        "segment_date": segment_date,
+                        "notes": f"Cross-month work - Day {segment_date}",
+                    }
+                    for segment_date in (
+                        date(2026, 1, 28),  # End of Month 1
+                        date(2026, 1, 29),  # End of Month 1
+                        date(2026, 2, 1),  # Start of Month 2
+                        date(2026, 2, 2),  # Start of Month 2
+                    )
+                ],
+            },
+        ],
+        "summary": ["✓ Created worklog with segments spanning Jan-Feb boundary"],
+    },
+    {
+        # Scenario 6: Time Segment Deletion
+        # - Time segment gets soft-deleted after initial logging
+        # - Should not appear in settlement calculations
+        "title": "Scenario 6: Deleted Time Segment",
+        "worker": "worker_c",
+        "worklogs": [
+            {
+                "task_identifier": "TASK-006-DELETED",
+                "segments": [
+                    # Active segment
+                    {
+                        "hours_worked": _HRS_5,
+                        "hourly_rate": _RATE_50,
+                        "segment_date": date(2026, 1, 20),
+                        "notes": "Valid work",
+                    },
+                    # Soft-deleted segment (disputed/removed)
+                    {
+                        "hours_worked": _HRS_3,
+                        "hourly_rate": _RATE_50,
+                        "segment_date": date(2026, 1, 21),
+                        "notes": "Disputed work - removed",
+                        "deleted_at": datetime(2026, 1, 25, 10, 0, 0),
+                    },
+                ],
+            },
+        ],
+        "summary": [
+            "✓ Created worklog with 1 active + 1 deleted segment",
+            "  Only $250 (5 hours) should be paid, not $400",
+        ],
+    },
+]
+
+
+def seed_scenarios(
+    session: Session,
+    users: dict[str, uuid.UUID],
+    scenarios: list[dict[str, Any]] = SCENARIOS,
 ) -> None:
     """
-    Scenario 2: Retroactive Adjustments
-    - Month 1: Worker B logs 20 hours → Should be paid $1000
-    - Month 2: Quality issue → $200 deduction applied
-    - Month 2: Worker B logs 10 hours → Should be paid $500 - $200 = $300
-    """
-    print("Creating Scenario 2: Retroactive Adjustments...")
+    Insert all scenarios with one executemany per table.
 
-    # Month 1 worklog
-    worklog_month1 = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-002-MONTH1",
-    )
-    session.add(worklog_month1)
-    session.flush()
-
-    # Month 1 time segments
-    base_date_m1 = date(2026, 1, 5)
-    for i in range(4):
-        segment = TimeSegment(
-            worklog_id=worklog_month1.id,
-            hours_worked=Decimal("5.00"),
-            hourly_rate=Decimal("50.00"),
-            segment_date=base_date_m1 + timedelta(days=i * 2),
-            notes=f"Month 1 work - Part {i+1}",
-        )
-        session.add(segment)
-
-    # Simulate that Month 1 was settled and PAID
-    settlement_m1 = Settlement(
-        period_start=date(2026, 1, 1),
-        period_end=date(2026, 1, 31),
-        run_at=datetime(2026, 2, 1, 0, 0, 0),
-        status=SettlementStatus.COMPLETED,
-        total_remittances_generated=1,
-    )
-    session.add(settlement_m1)
-    session.flush()
-
-    remittance_m1 = Remittance(
-        settlement_id=settlement_m1.id,
-        worker_user_id=worker_id,
-        gross_amount=Decimal("1000.00"),
-        adjustments_amount=Decimal("0.00"),
-        net_amount=Decimal("1000.00"),
-        status=RemittanceStatus.PAID,
-        paid_at=datetime(2026, 2, 2, 0, 0, 0),
-    )
-    session.add(remittance_m1)
-    session.flush()
-
-    # Create remittance lines for paid segments
-    segments_m1 = session.exec(
-        select(TimeSegment).where(TimeSegment.worklog_id == worklog_month1.id)
-    ).all()
-    for segment in segments_m1:
-        line = RemittanceLine(
-            remittance_id=remittance_m1.id,
-            time_segment_id=segment.id,
-            amount=segment.hours_worked * segment.hourly_rate,
-        )
-        session.add(line)
-
-    # Month 2: Add retroactive adjustment for Month 1 work
-    adjustment = Adjustment(
-        worklog_id=worklog_month1.id,
-        adjustment_type=AdjustmentType.DEDUCTION,
-        amount=Decimal("200.00"),
-        reason="Quality issue found in Month 1 deliverables",
-    )
-    session.add(adjustment)
+    Primary keys are generated client-side (as the models' default factories
+    would), so child rows can reference their parents without flushing or
+    reading IDs back from the database.
 
-    # Month 2: New worklog
-    worklog_month2 = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-002-MONTH2",
-    )
-    session.add(worklog_month2)
-    session.flush()
-
-    # Month 2 time segments
-    base_date_m2 = date(2026, 2, 5)
-    for i in range(2):
-        segment = TimeSegment(
-            worklog_id=worklog_month2.id,
-            hours_worked=Decimal("5.00"),
-            hourly_rate=Decimal("50.00"),
-            segment_date=base_date_m2 + timedelta(days=i * 2),
-            notes=f"Month 2 work - Part {i+1}",
-        )
-        session.add(segment)
-
-    session.commit()
-    print(f"✓ Created Month 1 worklog (PAID) with retroactive $200 deduction")
-    print(f"✓ Created Month 2 worklog with 10 hours (should net $300 with adjustment)")
-
-
-def seed_scenario_3_failed_settlement_retry(
-    session: Session, worker_id: uuid.UUID
-) -> None:
+    Scenarios whose worklogs already exist are skipped, so re-running the
+    script is a cheap no-op instead of duplicating the seed data.
     """
-    Scenario 3: Failed Settlement Retry
-    - Month 1: Worker C settlement fails → Status FAILED
-    - Month 2: New settlement includes Month 1 work + Month 2 work
-    """
-    print("Creating Scenario 3: Failed Settlement Retry...")
-
-    # Month 1 worklog
-    worklog_month1 = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-003-FAILED",
-    )
-    session.add(worklog_month1)
-    session.flush()
-
-    # Month 1 time segments
-    base_date = date(2026, 1, 10)
-    segments_m1 = []
-    for i in range(3):
-        segment = TimeSegment(
-            worklog_id=worklog_month1.id,
-            hours_worked=Decimal("8.00"),
-            hourly_rate=Decimal("60.00"),
-            segment_date=base_date + timedelta(days=i * 3),
-            notes=f"Failed settlement work - Part {i+1}",
-        )
-        session.add(segment)
-        session.flush()
-        segments_m1.append(segment)
-
-    # Create failed settlement
-    settlement_failed = Settlement(
-        period_start=date(2026, 1, 1),
-        period_end=date(2026, 1, 31),
-        run_at=datetime(2026, 2, 1, 0, 0, 0),
-        status=SettlementStatus.COMPLETED,
-        total_remittances_generated=1,
-    )
-    session.add(settlement_failed)
-    session.flush()
-
-    remittance_failed = Remittance(
-        settlement_id=settlement_failed.id,
-        worker_user_id=worker_id,
-        gross_amount=Decimal("1440.00"),  # 24 hours * $60
-        adjustments_amount=Decimal("0.00"),
-        net_amount=Decimal("1440.00"),
-        status=RemittanceStatus.FAILED,  # Payment failed!
-    )
-    session.add(remittance_failed)
-    session.flush()
-
-    # Create remittance lines for failed remittance
-    for segment in segments_m1:
-        line = RemittanceLine(
-            remittance_id=remittance_failed.id,
-            time_segment_id=segment.id,
-            amount=segment.hours_worked * segment.hourly_rate,
-        )
-        session.add(line)
-
-    session.commit()
-    print(f"✓ Created failed remittance for Worker C ($1440 unpaid)")
-    print(f"  Next settlement should reconcile this failed payment")
-
-
-def seed_scenario_4_partial_worklog_settlement(
-    session: Session, worker_id: uuid.UUID
-) -> None:
-    """
-    Scenario 4: Partial WorkLog Settlement
-    - WorkLog has 3 time segments initially
-    - First 2 segments get paid in Month 1
-    - 3rd segment added later, should be paid in Month 2
-    """
-    print("Creating Scenario 4: Partial WorkLog Settlement...")
-
-    # Create worklog
-    worklog = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-004-PARTIAL",
-    )
-    session.add(worklog)
-    session.flush()
-
-    # Add first 2 time segments (will be paid)
-    base_date = date(2026, 1, 8)
-    segments_paid = []
-    for i in range(2):
-        segment = TimeSegment(
-            worklog_id=worklog.id,
-            hours_worked=Decimal("4.00"),
-            hourly_rate=Decimal("45.00"),
-            segment_date=base_date + timedelta(days=i),
-            notes=f"Initial work - Day {i+1}",
-        )
-        session.add(segment)
-        session.flush()
-        segments_paid.append(segment)
-
-    # Simulate paid settlement for first 2 segments
-    settlement = Settlement(
-        period_start=date(2026, 1, 1),
-        period_end=date(2026, 1, 31),
-        run_at=datetime(2026, 2, 1, 0, 0, 0),
-        status=SettlementStatus.COMPLETED,
-        total_remittances_generated=1,
-    )
-    session.add(settlement)
-    session.flush()
-
-    remittance = Remittance(
-        settlement_id=settlement.id,
-        worker_user_id=worker_id,
-        gross_amount=Decimal("360.00"),  # 8 hours * $45
-        adjustments_amount=Decimal("0.00"),
-        net_amount=Decimal("360.00"),
-        status=RemittanceStatus.PAID,
-        paid_at=datetime(2026, 2, 2, 0, 0, 0),
-    )
-    session.add(remittance)
-    session.flush()
-
-    for segment in segments_paid:
-        line = RemittanceLine(
-            remittance_id=remittance.id,
-            time_segment_id=segment.id,
-            amount=segment.hours_worked * segment.hourly_rate,
-        )
-        session.add(line)
-
-    # Add 3rd segment later (unpaid)
-    segment_unpaid = TimeSegment(
-        worklog_id=worklog.id,
-        hours_worked=Decimal("6.00"),
-        hourly_rate=Decimal("45.00"),
-        segment_date=date(2026, 2, 15),  # Added in Month 2
-        notes="Additional work added later",
-    )
-    session.add(segment_unpaid)
-
-    session.commit()
-    print(f"✓ Created partially settled worklog")
-    print(f"  - 2 segments PAID ($360)")
-    print(f"  - 1 segment UNPAID ($270) - to be paid in next settlement")
-
-
-def seed_scenario_5_multi_month_segments(
-    session: Session, worker_id: uuid.UUID
-) -> None:
-    """
-    Scenario 5: Multi-Month Time Segments
-    - Time segments span across settlement period boundary
-    - Proper date-based filtering
-    """
-    print("Creating Scenario 5: Multi-Month Time Segments...")
-
-    # Create worklog
-    worklog = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-005-MULTIMONTH",
-    )
-    session.add(worklog)
-    session.flush()
-
-    # Add segments spanning two months
-    dates = [
-        date(2026, 1, 28),  # End of Month 1
-        date(2026, 1, 29),  # End of Month 1
-        date(2026, 2, 1),  # Start of Month 2
-        date(2026, 2, 2),  # Start of Month 2
+    task_identifiers = [
+        worklog["task_identifier"]
+        for scenario in scenarios
+        for worklog in scenario["worklogs"]
     ]
-
-    for i, segment_date in enumerate(dates):
-        segment = TimeSegment(
-            worklog_id=worklog.id,
-            hours_worked=Decimal("3.00"),
-            hourly_rate=Decimal("55.00"),
-            segment_date=segment_date,
-            notes=f"Cross-month work - Day {segment_date}",
-        )
-        session.add(segment)
-
-    session.commit()
-    print(f"✓ Created worklog with segments spanning Jan-Feb boundary")
-
-
-def seed_scenario_6_deleted_time_segment(
-    session: Session, worker_id: uuid.UUID
-) -> None:
-    """
-    Scenario 6: Time Segment Deletion
-    - Time segment gets soft-deleted after initial logging
-    - Should not appear in settlement calculations
-    """
-    print("Creating Scenario 6: Deleted Time Segment...")
-
-    # Create worklog
-    worklog = WorkLog(
-        worker_user_id=worker_id,
-        task_identifier="TASK-006-DELETED",
+    already_seeded = set(
+        session.exec(
+            select(WorkLog.task_identifier).where(
+                col(WorkLog.task_identifier).in_(task_identifiers)
+            )
+        ).all()
     )
-    session.add(worklog)
-    session.flush()
-
-    # Add active segment
-    segment_active = TimeSegment(
-        worklog_id=worklog.id,
-        hours_worked=Decimal("5.00"),
-        hourly_rate=Decimal("50.00"),
-        segment_date=date(2026, 1, 20),
-        notes="Valid work",
-    )
-    session.add(segment_active)
-
-    # Add soft-deleted segment (disputed/removed)
-    segment_deleted = TimeSegment(
-        worklog_id=worklog.id,
-        hours_worked=Decimal("3.00"),
-        hourly_rate=Decimal("50.00"),
-        segment_date=date(2026, 1, 21),
-        notes="Disputed work - removed",
-        deleted_at=datetime(2026, 1, 25, 10, 0, 0),  # Soft deleted
-    )
-    session.add(segment_deleted)
-
-    session.commit()
-    print(f"✓ Created worklog with 1 active + 1 deleted segment")
-    print(f"  Only $250 (5 hours) should be paid, not $400")
+    pending = []
+    for scenario in scenarios:
+        if any(
+            worklog["task_identifier"] in already_seeded
+            for worklog in scenario["worklogs"]
+        ):
+            logger.info("Skipping %s (already seeded)", scenario["title"])
+        else:
+            pending.append(scenario)
+    scenarios = pending
+
+    worklog_rows: list[dict[str, Any]] = []
+    segment_rows: list[dict[str, Any]] = []
+    adjustment_rows: list[dict[str, Any]] = []
+    settlement_rows: list[dict[str, Any]] = []
+    remittance_rows: list[dict[str, Any]] = []
+    line_rows: list[dict[str, Any]] = []
+
+    for scenario in scenarios:
+        worker_id = users[scenario["worker"]]
+
+        remittance_id = None
+        if "remittance" in scenario:
+            settlement_id = uuid.uuid4()
+            remittance_id = uuid.uuid4()
+            settlement_rows.append({"id": settlement_id, **_JANUARY_SETTLEMENT})
+            remittance_rows.append(
+                {
+                    "id": remittance_id,
+                    "settlement_id": settlement_id,
+                    "worker_user_id": worker_id,
+                    "paid_at": None,
+                    **scenario["remittance"],
+                }
+            )
+
+        for worklog in scenario["worklogs"]:
+            worklog_id = uuid.uuid4()
+            worklog_rows.append(
+                {
+                    "id": worklog_id,
+                    "worker_user_id": worker_id,
+                    "task_identifier": worklog["task_identifier"],
+                }
+            )
+            for segment in worklog["segments"]:
+                segment_id = uuid.uuid4()
+                segment_rows.append(
+                    {
+                        "id": segment_id,
+                        "worklog_id": worklog_id,
+                        "hours_worked": segment["hours_worked"],
+                        "hourly_rate": segment["hourly_rate"],
+                        "segment_date": segment["segment_date"],
+                        "notes": segment["notes"],
+                        "deleted_at": segment.get("deleted_at"),
+                    }
+                )
+                if "remitted_amount" in segment:
+                    line_rows.append(
+                        {
+                            "remittance_id": remittance_id,
+                            "time_segment_id": segment_id,
+                            "amount": segment["remitted_amount"],
+                        }
+                    )
+            for adjustment in worklog.get("adjustments", []):
+                adjustment_rows.append({"worklog_id": worklog_id, **adjustment})
+
+    # Parents before children to satisfy foreign keys
+    for model, rows in (
+        (WorkLog, worklog_rows),
+        (TimeSegment, segment_rows),
+        (Adjustment, adjustment_rows),
+        (Settlement, settlement_rows),
+        (Remittance, remittance_rows),
+        (RemittanceLine, line_rows),
+    ):
+        if rows:
+            session.execute(insert(model), rows)
+
+    for scenario in scenarios:
+        logger.info("Created %s", scenario["title"])
+        for line in scenario["summary"]:
+            logger.info(line)
 
 
 def main() -> None:
     """Run all seed scenarios."""
-    print("\n" + "=" * 60)
-    print("SEEDING WORKLOG SETTLEMENT SYSTEM TEST DATA")
-    print("=" * 60 + "\n")
+    logger.info(
+        "\n%s\nSEEDING WORKLOG SETTLEMENT SYSTEM TEST DATA\n%s\n", _BANNER, _BANNER
+    )
 
     with Session(engine) as session:
         # Get test users
         users = create_test_users(session)
         if not users:
-            print("ERROR: Cannot seed data without users")
+            logger.error("Cannot seed data without users")
             return
 
-        # Seed all scenarios
-        seed_scenario_1_simple_happy_path(session, users["worker_a"])
-        seed_scenario_2_retroactive_adjustments(session, users["worker_b"])
-        seed_scenario_3_failed_settlement_retry(session, users["worker_c"])
-        seed_scenario_4_partial_worklog_settlement(session, users["worker_a"])
-        seed_scenario_5_multi_month_segments(session, users["worker_b"])
-        seed_scenario_6_deleted_time_segment(session, users["worker_c"])
-
-    print("\n" + "=" * 60)
-    print("✓ SEED DATA CREATION COMPLETE")
-    print("=" * 60 + "\n")
-    print("Next steps:")
-    print("1. Run: POST /api/v1/generate-remittances-for-all-users")
-    print("   with period_start=2026-01-01&period_end=2026-01-31")
-    print("2. Check: GET /api/v1/list-all-worklogs?remittanceStatus=UNREMITTED")
-    print("3. Verify settlement calculations match expected values\n")
+        # Seed all scenarios in a single transaction so a failure part-way
+        # through doesn't leave partial seed data behind
+        try:
+            seed_scenarios(session, users)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+    logger.info("\n%s\n✓ SEED DATA CREATION COMPLETE\n%s\n", _BANNER, _BANNER)
+    logger.info(
+        "Next steps:\n"
+        "1. Run: POST /api/v1/generate-remittances-for-all-users\n"
+        "   with period_start=2026-01-01&period_end=2026-01-31\n"
+        "2. Check: GET /api/v1/list-all-worklogs?remittanceStatus=UNREMITTED\n"
+        "3. Verify settlement calculations match expected values\n"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,10 @@
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.fixture
+def email_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Configure enough SMTP settings for emails to count as enabled."""
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(settings, "EMAILS_FROM_EMAIL", "test@example.com")
@@ -16,35 +16,36 @@ from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete, select
+from sqlmodel import Session, select
 
 from app.api.routes.settlements.service import SettlementService, WorkLogService
 from app.core.db import engine
-from app.main import app
 from app.models import (
     Adjustment,
     AdjustmentType,
     Remittance,
     RemittanceLine,
     RemittanceStatus,
-    Settlement,
     TimeSegment,
     User,
     WorkLog,
     WorkLogRemittanceFilter,
 )
 
-client = TestClient(app)
+# Children before parents to respect foreign keys; sent as one batch
+_CLEANUP_SQL = (
+    "DELETE FROM remittance_line; "
+    "DELETE FROM remittance; "
+    "DELETE FROM settlement; "
+    "DELETE FROM adjustment; "
+    "DELETE FROM time_segment; "
+    "DELETE FROM worklog;"
+)
 
 
 def _cleanup_all_data(session: Session) -> None:
     """Clean up all test data."""
-    session.exec(delete(RemittanceLine))
-    session.exec(delete(Remittance))
-    session.exec(delete(Settlement))
-    session.exec(delete(Adjustment))
-    session.exec(delete(TimeSegment))
-    session.exec(delete(WorkLog))
+    session.connection().exec_driver_sql(_CLEANUP_SQL)
     session.commit()
 
 
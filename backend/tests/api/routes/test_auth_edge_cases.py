@@ -2,8 +2,7 @@
 Tests for auth service edge cases.
 """
 
-from unittest.mock import patch
-
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
@@ -19,7 +18,7 @@ def test_login_inactive_user(client: TestClient, db: Session) -> None:
     """Test login with inactive user."""
     email = random_email()
     password = random_lower_string()
-    user_create = UserCreate(
+    user_create = UserCreate.model_construct(
         email=email,
         password=password,
         is_active=False,
@@ -54,7 +53,7 @@ def test_reset_password_inactive_user(client: TestClient, db: Session) -> None:
     password = random_lower_string()
     new_password = random_lower_string()
 
-    user_create = UserCreate(
+    user_create = UserCreate.model_construct(
         email=email,
         password=password,
         is_active=False,
@@ -73,13 +72,14 @@ def test_reset_password_inactive_user(client: TestClient, db: Session) -> None:
     assert "Inactive user" in r.json()["detail"]
 
 
+@pytest.mark.usefixtures("email_settings")
 def test_recover_password_html_content(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
     """Test password recovery HTML content endpoint."""
     email = random_email()
     password = random_lower_string()
-    user_create = UserCreate(
+    user_create = UserCreate.model_construct(
         email=email,
         password=password,
         is_active=True,
@@ -87,16 +87,12 @@ def test_recover_password_html_content(
     )
     crud.create_user(session=db, user_create=user_create)
 
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.EMAILS_FROM_EMAIL", "test@example.com"),
-    ):
-        r = client.post(
-            f"{settings.API_V1_STR}/password-recovery-html-content/{email}",
-            headers=superuser_token_headers,
-        )
-        assert r.status_code == 200
-        assert "text/html" in r.headers["content-type"]
+    r = client.post(
+        f"{settings.API_V1_STR}/password-recovery-html-content/{email}",
+        headers=superuser_token_headers,
+    )
+    assert r.status_code == 200
+    assert "text/html" in r.headers["content-type"]
 
 
 def test_recover_password_html_content_user_not_found(
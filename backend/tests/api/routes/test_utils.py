@@ -4,6 +4,7 @@ Tests for utils endpoints.
 
 from unittest.mock import patch
 
+import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
@@ -18,16 +19,16 @@ def test_health_check(client: TestClient) -> None:
     assert r.json() is True
 
 
+@pytest.mark.usefixtures("email_settings")
 def test_test_email(
-    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+    client: TestClient,
+    superuser_token_headers: dict[str, str],
+    db: Session,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test email sending endpoint."""
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.SMTP_USER", "admin@example.com"),
-        patch("app.core.config.settings.EMAILS_FROM_EMAIL", "test@example.com"),
-        patch("app.api.routes.utils.service.send_email") as mock_send_email,
-    ):
+    monkeypatch.setattr(settings, "SMTP_USER", "admin@example.com")
+    with patch("app.api.routes.utils.service.send_email") as mock_send_email:
         email = "test@example.com"
         # For POST requests, FastAPI treats simple types as query parameters by default
         # So we send it as a query parameter
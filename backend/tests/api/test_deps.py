@@ -15,6 +15,15 @@ from app.core.security import create_access_token
 from app.models import UserCreate
 from tests.utils.utils import random_email, random_lower_string
 
+_EXPIRES_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+# Neither token depends on test state, so sign them once per module
+_FAKE_USER_TOKEN = create_access_token(str(uuid.uuid4()), expires_delta=_EXPIRES_DELTA)
+_INVALID_PAYLOAD_TOKEN = jwt.encode(
+    {"invalid": "data"},
+    settings.SECRET_KEY,
+    algorithm="HS256",
+)
+
 
 def test_get_current_user_invalid_token(client: TestClient) -> None:
     """Test get_current_user with invalid token."""
@@ -29,11 +38,8 @@ def test_get_current_user_invalid_token(client: TestClient) -> None:
 
 def test_get_current_user_not_found(client: TestClient) -> None:
     """Test get_current_user with non-existent user."""
-    # Create a token for a non-existent user (use a valid UUID format)
-    fake_user_id = uuid.uuid4()
-    expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = create_access_token(str(fake_user_id), expires_delta=expires_delta)
-    headers = {"Authorization": f"Bearer {token}"}
+    # Token for a non-existent user (valid UUID format)
+    headers = {"Authorization": f"Bearer {_FAKE_USER_TOKEN}"}
 
     r = client.get(
         f"{settings.API_V1_STR}/users/me",
@@ -47,7 +53,7 @@ def test_get_current_user_inactive(client: TestClient, db: Session) -> None:
     """Test get_current_user with inactive user."""
     email = random_email()
     password = random_lower_string()
-    user_create = UserCreate(
+    user_create = UserCreate.model_construct(
         email=email,
         password=password,
         is_active=False,
@@ -57,8 +63,7 @@ def test_get_current_user_inactive(client: TestClient, db: Session) -> None:
     # Ensure user is committed and refreshed
     db.refresh(user)
 
-    expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    token = create_access_token(str(user.id), expires_delta=expires_delta)
+    token = create_access_token(str(user.id), expires_delta=_EXPIRES_DELTA)
     headers = {"Authorization": f"Bearer {token}"}
 
     r = client.get(
@@ -71,14 +76,8 @@ def test_get_current_user_inactive(client: TestClient, db: Session) -> None:
 
 def test_get_current_user_invalid_token_payload(client: TestClient) -> None:
     """Test get_current_user with invalid token payload."""
-    # Create a token with invalid payload
-    invalid_payload = {"invalid": "data"}
-    token = jwt.encode(
-        invalid_payload,
-        settings.SECRET_KEY,
-        algorithm="HS256",
-    )
-    headers = {"Authorization": f"Bearer {token}"}
+    # Token with an invalid payload
+    headers = {"Authorization": f"Bearer {_INVALID_PAYLOAD_TOKEN}"}
 
     r = client.get(
         f"{settings.API_V1_STR}/users/me",
@@ -1,52 +1,107 @@
-from collections.abc import Generator
+import os
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session, delete
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, text
+from sqlmodel import Session, SQLModel, delete
 
+from app import crud
 from app.core.config import settings
 from app.core.db import engine, init_db
 from app.main import app
-from app.models import (
-    Adjustment,
-    Item,
-    Remittance,
-    RemittanceLine,
-    Settlement,
-    TimeSegment,
-    User,
-    WorkLog,
-)
+from app.models import User
 from tests.utils.user import authentication_token_from_email
 from tests.utils.utils import get_superuser_token_headers
 
+# Under pytest-xdist every worker gets its own schema, so parallel workers
+# never see or wipe each other's rows
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_WORKER_SCHEMA = f"test_{_XDIST_WORKER}" if _XDIST_WORKER else None
+
+if _WORKER_SCHEMA:
+
+    @event.listens_for(engine, "connect", insert=True)
+    def _set_worker_search_path(dbapi_connection: Any, _record: Any) -> None:
+        # Runs before SQLAlchemy inspects the connection, so the worker schema
+        # also becomes the dialect's default schema. Autocommit keeps the
+        # SET from being undone by the pool's rollback-on-return.
+        autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f'CREATE SCHEMA IF NOT EXISTS "{_WORKER_SCHEMA}"')
+            cursor.execute(f'SET SESSION search_path TO "{_WORKER_SCHEMA}"')
+        dbapi_connection.autocommit = autocommit
+
 
 @pytest.fixture(scope="session", autouse=True)
 def db() -> Generator[Session, None, None]:
+    """
+    Session shared by the whole test run.
+
+    Tests reuse the already-migrated schema; no tables are created or dropped
+    here. Only rows are wiped at teardown. Under pytest-xdist each worker
+    builds its tables in a schema of its own and drops it at teardown.
+    """
+    if _WORKER_SCHEMA:
+        SQLModel.metadata.create_all(engine)
     with Session(engine) as session:
         init_db(session)
         yield session
-        # Delete in order to respect foreign key constraints
-        # Use explicit deletes to ensure they execute
-        session.execute(delete(RemittanceLine))
-        session.execute(delete(Remittance))
-        session.execute(delete(Settlement))
-        session.execute(delete(Adjustment))
-        session.execute(delete(TimeSegment))
-        session.execute(delete(WorkLog))
-        session.execute(delete(Item))
+        if _WORKER_SCHEMA:
+            session.execute(text(f'DROP SCHEMA "{_WORKER_SCHEMA}" CASCADE'))
+            session.commit()
+            return
+        # One TRUNCATE empties every worklog/item table; CASCADE covers the
+        # foreign keys between them, so no delete ordering is needed
+        session.execute(
+            text(
+                "TRUNCATE remittance_line, remittance, settlement, adjustment, "
+                "time_segment, worklog, item RESTART IDENTITY CASCADE"
+            )
+        )
         # Only delete non-superuser users to avoid deleting the init_db superuser
-        # But first ensure all their worklogs are deleted (done above)
         session.execute(delete(User).where(User.is_superuser == False))  # noqa: E712
         session.commit()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture
+def rollback_db() -> Generator[Session, None, None]:
+    """
+    Per-test session inside an outer transaction that is rolled back.
+
+    Runs against the schema the session-wide db fixture already prepared.
+    Commits only release a SAVEPOINT, so nothing the test writes persists.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
 def client() -> Generator[TestClient, None, None]:
     with TestClient(app) as c:
         yield c
 
 
+@pytest.fixture
+async def async_client() -> AsyncGenerator[AsyncClient, None]:
+    # Calls the ASGI app in the test's event loop, without TestClient's
+    # per-request thread portal. Cheap to build, so function-scoped.
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as c:
+        yield c
+
+
 @pytest.fixture(scope="module")
 def superuser_token_headers(client: TestClient) -> dict[str, str]:
     return get_superuser_token_headers(client)
@@ -57,3 +112,14 @@ def normal_user_token_headers(client: TestClient, db: Session) -> dict[str, str]
     return authentication_token_from_email(
         client=client, email=settings.EMAIL_TEST_USER, db=db
     )
+
+
+@pytest.fixture(scope="module")
+def normal_user(
+    db: Session,
+    normal_user_token_headers: dict[str, str],  # noqa: ARG001
+) -> User:
+    # Depends on normal_user_token_headers, which creates the user if missing
+    user = crud.get_user_by_email(session=db, email=settings.EMAIL_TEST_USER)
+    assert user is not None
+    return user
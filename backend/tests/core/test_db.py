@@ -2,33 +2,37 @@
 Tests for database initialization.
 """
 
-from sqlmodel import Session, select
+import pytest
+from sqlmodel import Session, func, select
 
-from app.core.db import init_db
 from app.core.config import settings
+from app.core.db import init_db
 from app.models import User
+from tests.utils.utils import random_email
 
 
-def test_init_db_creates_superuser(db: Session) -> None:
+def test_init_db_creates_superuser(
+    rollback_db: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that init_db creates superuser if it doesn't exist."""
-    # Get existing superuser
-    existing_user = db.exec(
-        select(User).where(User.email == settings.FIRST_SUPERUSER)
-    ).first()
-    
-    # If superuser exists, verify it's correct
-    if existing_user:
-        assert existing_user.is_superuser is True
-        assert existing_user.email == settings.FIRST_SUPERUSER
-    else:
-        # If it doesn't exist, init_db should create it
-        # But we can't easily test this without breaking other tests
-        # So we'll just verify the function runs without error
-        init_db(db)
-        # Verify superuser exists after init
-        user = db.exec(
-            select(User).where(User.email == settings.FIRST_SUPERUSER)
-        ).first()
-        assert user is not None
-        assert user.is_superuser is True
+    email = random_email()
+    monkeypatch.setattr(settings, "FIRST_SUPERUSER", email)
+
+    init_db(rollback_db)
+
+    user = rollback_db.exec(select(User).where(User.email == email)).first()
+    assert user is not None
+    assert user.is_superuser is True
+
+
+def test_init_db_is_idempotent(rollback_db: Session) -> None:
+    """Test that init_db leaves an existing superuser alone."""
+    # The session-wide db fixture has already run init_db once
+    init_db(rollback_db)
 
+    count = rollback_db.exec(
+        select(func.count())
+        .select_from(User)
+        .where(User.email == settings.FIRST_SUPERUSER)
+    ).one()
+    assert count == 1
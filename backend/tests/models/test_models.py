@@ -7,13 +7,16 @@ from decimal import Decimal
 
 from app.models import TimeSegment
 
+_HOURS = Decimal("10.5")
+_RATE = Decimal("25.00")
+_EXPECTED = Decimal("262.50")
+
 
 def test_time_segment_gross_amount() -> None:
     """Test TimeSegment gross_amount property."""
     segment = TimeSegment(
-        hours_worked=Decimal("10.5"),
-        hourly_rate=Decimal("25.00"),
+        hours_worked=_HOURS,
+        hourly_rate=_RATE,
         segment_date=date(2024, 1, 1),
     )
-    assert segment.gross_amount == Decimal("262.50")
-
+    assert segment.gross_amount == _EXPECTED
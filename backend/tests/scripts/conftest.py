@@ -0,0 +1,13 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_session_ctx() -> tuple[MagicMock, MagicMock]:
+    """Mock for the ``Session(...)`` context manager and the session it yields."""
+    session = MagicMock()
+    ctx = MagicMock()
+    ctx.__enter__.return_value = session
+    ctx.__exit__.return_value = False
+    return ctx, session
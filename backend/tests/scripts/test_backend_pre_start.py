@@ -3,17 +3,12 @@ from unittest.mock import MagicMock, patch
 from app.backend_pre_start import init, logger
 
 
-def test_init_successful_connection() -> None:
+def test_init_successful_connection(
+    mock_session_ctx: tuple[MagicMock, MagicMock],
+) -> None:
     engine_mock = MagicMock()
-
-    session_mock = MagicMock()
-    exec_mock = MagicMock(return_value=True)
-    session_mock.configure_mock(**{"exec.return_value": exec_mock})
-
-    # Create a context manager mock that returns our session_mock
-    session_context_mock = MagicMock()
-    session_context_mock.__enter__ = MagicMock(return_value=session_mock)
-    session_context_mock.__exit__ = MagicMock(return_value=False)
+    session_context_mock, session_mock = mock_session_ctx
+    session_mock.exec.return_value = True
 
     with (
         patch("app.backend_pre_start.Session", return_value=session_context_mock),
@@ -2,18 +2,17 @@
 Tests for initial_data.py
 """
 
-import runpy
+import ast
+import inspect
 from unittest.mock import MagicMock, patch
 
+import app.initial_data
 from app.initial_data import init, logger, main
 
 
-def test_init() -> None:
+def test_init(mock_session_ctx: tuple[MagicMock, MagicMock]) -> None:
     """Test init function."""
-    session_mock = MagicMock()
-    session_context_mock = MagicMock()
-    session_context_mock.__enter__ = MagicMock(return_value=session_mock)
-    session_context_mock.__exit__ = MagicMock(return_value=False)
+    session_context_mock, session_mock = mock_session_ctx
 
     with (
         patch("app.initial_data.Session", return_value=session_context_mock),
@@ -37,26 +36,13 @@ def test_main() -> None:
 def test_main_entry_point() -> None:
     """Test main entry point.
 
-    This verifies that when the module is run as a script (python -m app.initial_data),
-    the main() function gets executed. Since runpy.run_module with run_name='__main__'
-    actually executes the code, we need to mock the database dependencies.
+    Checks that running the module as a script (python -m app.initial_data)
+    calls main(), by inspecting the module source instead of re-executing it
+    with runpy.
     """
-    import sys
+    tree = ast.parse(inspect.getsource(app.initial_data))
+    guard = tree.body[-1]
 
-    # First, set up mocks for the database dependencies
-    with (
-        patch("app.core.db.init_db") as mock_init_db,
-        patch("app.core.db.engine"),
-    ):
-        # Remove the module from cache to get a fresh load
-        for module_name in list(sys.modules.keys()):
-            if module_name == "app.initial_data" or module_name.startswith(
-                "app.initial_data."
-            ):
-                del sys.modules[module_name]
-
-        # Run the module as if it were the main script
-        runpy.run_module("app.initial_data", run_name="__main__")
-
-        # Verify init_db was called (main -> init -> init_db)
-        mock_init_db.assert_called_once()
+    assert isinstance(guard, ast.If)
+    assert ast.unparse(guard.test) == "__name__ == '__main__'"
+    assert [ast.unparse(stmt) for stmt in guard.body] == ["main()"]
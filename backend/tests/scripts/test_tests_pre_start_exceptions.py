@@ -5,64 +5,40 @@ Tests for tests_pre_start.py exception handling.
 from unittest.mock import MagicMock, patch
 
 import pytest
+from tenacity import RetryError, stop_after_attempt, wait_none
 
 from app.tests_pre_start import init, logger
 
 
-def test_init_exception() -> None:
+def test_init_exception(mock_session_ctx: tuple[MagicMock, MagicMock]) -> None:
     """Test init function exception handling.
 
-    Note: The init function has a @retry decorator that will retry up to max_tries times.
-    To speed up the test, we'll access the underlying function and test it directly,
-    or we can test that the exception is eventually raised after retries.
+    The @retry policy is swapped for a single attempt with no wait, so the
+    failure surfaces on the first call instead of after max_tries sleeps.
     """
     engine_mock = MagicMock()
-    session_mock = MagicMock()
-    exec_mock = MagicMock(side_effect=Exception("Database connection failed"))
-    session_mock.exec = exec_mock
+    session_context_mock, session_mock = mock_session_ctx
+    session_mock.exec.side_effect = Exception("Database connection failed")
 
-    session_context_mock = MagicMock()
-    session_context_mock.__enter__ = MagicMock(return_value=session_mock)
-    session_context_mock.__exit__ = MagicMock(return_value=False)
-
-    # Access the underlying function from the retry wrapper
-    # The retry decorator wraps the function, so we can access the original via __wrapped__
-    try:
-        original_init = init.__wrapped__
-    except AttributeError:
-        # If __wrapped__ doesn't exist, test the retry behavior directly
-        # by ensuring exception is eventually raised
-        with (
-            patch("app.tests_pre_start.Session", return_value=session_context_mock),
-            patch.object(logger, "error") as mock_logger_error,
-        ):
-            with pytest.raises(Exception, match="Database connection failed"):
-                # This will retry but eventually raise the exception
-                init(engine_mock)
-        # Assert logger was called after exception is raised
-        assert mock_logger_error.called
-    else:
-        # Test the original function directly (without retry)
-        with (
-            patch("app.tests_pre_start.Session", return_value=session_context_mock),
-            patch.object(logger, "error") as mock_logger_error,
-        ):
-            with pytest.raises(Exception, match="Database connection failed"):
-                original_init(engine_mock)
-        # Assert logger was called after exception is raised
-        mock_logger_error.assert_called_once()
+    with (
+        patch.object(init.retry, "stop", stop_after_attempt(1)),
+        patch.object(init.retry, "wait", wait_none()),
+        patch("app.tests_pre_start.Session", return_value=session_context_mock),
+        patch.object(logger, "error") as mock_logger_error,
+    ):
+        with pytest.raises(RetryError) as exc_info:
+            init(engine_mock)
+    # The original exception is kept on the last attempt
+    with pytest.raises(Exception, match="Database connection failed"):
+        exc_info.value.reraise()
+    mock_logger_error.assert_called_once()
 
 
-def test_init_success() -> None:
+def test_init_success(mock_session_ctx: tuple[MagicMock, MagicMock]) -> None:
     """Test init function successful execution."""
     engine_mock = MagicMock()
-    session_mock = MagicMock()
-    exec_mock = MagicMock(return_value=True)
-    session_mock.exec = exec_mock
-
-    session_context_mock = MagicMock()
-    session_context_mock.__enter__ = MagicMock(return_value=session_mock)
-    session_context_mock.__exit__ = MagicMock(return_value=False)
+    session_context_mock, session_mock = mock_session_ctx
+    session_mock.exec.return_value = True
 
     with (
         patch("app.tests_pre_start.Session", return_value=session_context_mock),
@@ -0,0 +1,12 @@
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_message() -> Generator[MagicMock, None, None]:
+    """Patch ``emails.Message`` so send_email never reaches an SMTP server."""
+    with patch("app.utils.emails.Message") as m:
+        m.return_value.send.return_value = True
+        yield m
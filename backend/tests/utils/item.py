@@ -1,3 +1,6 @@
+from typing import Any
+
+from sqlalchemy import insert
 from sqlmodel import Session
 
 from app import crud
@@ -14,3 +17,9 @@ def create_random_item(db: Session) -> Item:
     description = random_lower_string()
     item_in = ItemCreate(title=title, description=description)
     return crud.create_item(session=db, item_in=item_in, owner_id=owner_id)
+
+
+def bulk_create_items(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert item rows in a single executemany, bypassing the ORM."""
+    db.execute(insert(Item), rows)
+    db.commit()
@@ -4,76 +4,75 @@ Tests for utility functions.
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from app.core.config import settings
 from app.utils import (
     generate_new_account_email,
     send_email,
 )
 
+# Settings shared by both transports; each case adds its port/SSL/TLS/password
+SMTP_CFG = {
+    "SMTP_HOST": "smtp.example.com",
+    "SMTP_USER": "user@example.com",
+    "EMAILS_FROM_NAME": "Test",
+    "EMAILS_FROM_EMAIL": "test@example.com",
+}
 
-def test_send_email_with_ssl() -> None:
-    """Test send_email with SMTP_SSL enabled."""
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.SMTP_PORT", 465),
-        patch("app.core.config.settings.SMTP_SSL", True),
-        patch("app.core.config.settings.SMTP_TLS", False),
-        patch("app.core.config.settings.SMTP_USER", "user@example.com"),
-        patch("app.core.config.settings.SMTP_PASSWORD", "password"),
-        patch("app.core.config.settings.EMAILS_FROM_NAME", "Test"),
-        patch("app.core.config.settings.EMAILS_FROM_EMAIL", "test@example.com"),
-        patch("app.utils.emails.Message") as mock_message,
-    ):
-        mock_msg_instance = mock_message.return_value
-        mock_msg_instance.send.return_value = True
-
-        send_email(
-            email_to="recipient@example.com",
-            subject="Test",
-            html_content="<html>Test</html>",
-        )
-
-        # Verify SSL was set
-        call_args = mock_msg_instance.send.call_args
-        smtp_options = call_args.kwargs.get("smtp", {})
-        assert "ssl" in smtp_options
-        assert smtp_options["ssl"] is True
 
+@pytest.mark.parametrize(
+    "port, ssl, tls, password, transport",
+    [
+        pytest.param(465, True, False, "password", "ssl", id="ssl"),
+        pytest.param(587, False, True, "password123", "tls", id="tls"),
+    ],
+)
+def test_send_email_smtp_options(
+    monkeypatch: pytest.MonkeyPatch,
+    mock_message: MagicMock,
+    port: int,
+    ssl: bool,
+    tls: bool,
+    password: str,
+    transport: str,
+) -> None:
+    """Test send_email passes transport, user and password to SMTP."""
+    cfg = {
+        **SMTP_CFG,
+        "SMTP_PORT": port,
+        "SMTP_SSL": ssl,
+        "SMTP_TLS": tls,
+        "SMTP_PASSWORD": password,
+    }
+    for name, value in cfg.items():
+        monkeypatch.setattr(settings, name, value)
 
-def test_send_email_with_user_password() -> None:
-    """Test send_email with SMTP_USER and SMTP_PASSWORD."""
-    with (
-        patch("app.core.config.settings.SMTP_HOST", "smtp.example.com"),
-        patch("app.core.config.settings.SMTP_PORT", 587),
-        patch("app.core.config.settings.SMTP_TLS", True),
-        patch("app.core.config.settings.SMTP_SSL", False),
-        patch("app.core.config.settings.SMTP_USER", "user@example.com"),
-        patch("app.core.config.settings.SMTP_PASSWORD", "password123"),
-        patch("app.core.config.settings.EMAILS_FROM_NAME", "Test"),
-        patch("app.core.config.settings.EMAILS_FROM_EMAIL", "test@example.com"),
-        patch("app.utils.emails.Message") as mock_message,
-    ):
-        mock_msg_instance = mock_message.return_value
-        mock_msg_instance.send.return_value = True
-
-        send_email(
-            email_to="recipient@example.com",
-            subject="Test",
-            html_content="<html>Test</html>",
-        )
+    send_email(
+        email_to="recipient@example.com",
+        subject="Test",
+        html_content="<html>Test</html>",
+    )
 
-        # Verify user and password were set
-        call_args = mock_msg_instance.send.call_args
-        smtp_options = call_args.kwargs.get("smtp", {})
-        assert smtp_options["user"] == "user@example.com"
-        assert smtp_options["password"] == "password123"
+    # Verify transport, user and password were set
+    call_args = mock_message.return_value.send.call_args
+    assert call_args.kwargs["smtp"] == {
+        "host": "smtp.example.com",
+        "port": port,
+        transport: True,
+        "user": "user@example.com",
+        "password": password,
+    }
 
 
 def test_generate_new_account_email() -> None:
     """Test generate_new_account_email function."""
     with (
-        patch("app.core.config.settings.PROJECT_NAME", "Test Project"),
-        patch("app.core.config.settings.FRONTEND_HOST", "http://localhost:3000"),
+        patch.multiple(
+            settings,
+            PROJECT_NAME="Test Project",
+            FRONTEND_HOST="http://localhost:3000",
+        ),
         patch("app.utils.render_email_template") as mock_render,
     ):
         mock_render.return_value = "<html>New Account</html>"
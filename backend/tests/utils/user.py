@@ -1,4 +1,7 @@
+from typing import Any
+
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlmodel import Session
 
 from app import crud
@@ -27,6 +30,17 @@ def create_random_user(db: Session) -> User:
     return user
 
 
+def bulk_create_users(db: Session, rows: list[dict[str, Any]]) -> None:
+    """
+    Insert user rows in a single executemany, bypassing the ORM.
+
+    Rows without a hashed_password get a placeholder instead of paying for a
+    bcrypt hash per user, so these users can't log in.
+    """
+    db.execute(insert(User), [{"hashed_password": "dummy", **row} for row in rows])
+    db.commit()
+
+
 def authentication_token_from_email(
     *, client: TestClient, email: str, db: Session
 ) -> dict[str, str]:
@@ -1,17 +1,26 @@
-import random
-import string
+import secrets
+from typing import Any
 
+import orjson
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from app.core.config import settings
 
 
 def random_lower_string() -> str:
-    return "".join(random.choices(string.ascii_lowercase, k=32))
+    # 32 hex characters (0-9 and a-f); no caller needs letters only
+    return secrets.token_hex(16)
 
 
 def random_email() -> str:
-    return f"{random_lower_string()}@{random_lower_string()}.com"
+    # .local and similar special-use domains are rejected by EmailStr
+    return f"{secrets.token_hex(8)}@example.com"
+
+
+def fast_json(response: Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json module."""
+    return orjson.loads(response.content)
 
 
 def get_superuser_token_headers(client: TestClient) -> dict[str, str]: